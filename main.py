@@ -22,6 +22,7 @@ from ui.animations import AnimationManager
 from network.client import GameClient
 from network.protocol import MessageType
 from utils.config_manager import config_manager
+from utils import perf
 
 class MonopolyGame:
     """大富翁游戏主类"""
@@ -120,6 +121,11 @@ class MonopolyGame:
                 self.running = False
                 self.cleanup()
             
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                # 窗口被重新显示时画面内容可能已丢失，下一帧整屏重绘
+                if self.renderer:
+                    self.renderer.invalidate()
+            
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # 检查设置按钮
                 if self.settings_button_rect.collidepoint(event.pos):
@@ -149,7 +155,10 @@ class MonopolyGame:
                     self.handle_results_click(event.pos)
             
             elif event.type == pygame.KEYDOWN:
-                if self.game_state == GAME_STATE_LOBBY and self.input_active:
+                if event.key == pygame.K_F3:
+                    # F3切换性能统计浮层
+                    perf.toggle()
+                elif self.game_state == GAME_STATE_LOBBY and self.input_active:
                     self.handle_text_input(event)
                 elif self.show_nickname_input and self.nickname_input_active:
                     self.handle_nickname_text_input(event)
@@ -747,10 +756,8 @@ class MonopolyGame:
         if not self.game_logic or not self.renderer or not self.animation_manager:
             return
             
-        if self.renderer and hasattr(self.renderer, 'draw_ui'):
-            button_rect = self.renderer.draw_ui(self.game_logic)
-        else:
-            button_rect = None
+        # 使用最近一帧绘制的按钮区域
+        button_rect = self.renderer.button_rect
         
         if button_rect and button_rect.collidepoint(pos):
             # 首先检查是否可以进行操作（联机游戏时检查是否是本地玩家回合）
@@ -1142,6 +1149,16 @@ class MonopolyGame:
 
     def render(self):
         """渲染游戏画面"""
+        if (self.game_state == GAME_STATE_PLAYING and not self.show_settings and
+                not self.show_nickname_input and not self.error_message):
+            # 游戏进行中且没有覆盖层时，只更新发生变化的区域
+            dirty_rects = self.draw_game_screen()
+            if dirty_rects:
+                self.draw_settings_button()
+                dirty_rects.append(self.settings_button_rect)
+                pygame.display.update(dirty_rects)
+            return
+        
         self.screen.fill(WHITE)
         
         if self.game_state == GAME_STATE_START:
@@ -1154,12 +1171,7 @@ class MonopolyGame:
             self.draw_results_screen()
         
         # 绘制设置按钮（齿轮图标）
-        pygame.draw.rect(self.screen, GRAY, self.settings_button_rect)
-        pygame.draw.rect(self.screen, BLACK, self.settings_button_rect, 2)
-        # 简化的齿轮图标（使用字符）
-        gear_text = self.font.render("⚙", True, WHITE)
-        gear_rect = gear_text.get_rect(center=self.settings_button_rect.center)
-        self.screen.blit(gear_text, gear_rect)
+        self.draw_settings_button()
         
         # 绘制设置菜单
         if self.show_settings:
@@ -1184,6 +1196,19 @@ class MonopolyGame:
         
         # 更新显示
         pygame.display.flip()
+        
+        # 整屏重绘后游戏画面已被覆盖，下一帧需要整屏重绘
+        if self.renderer:
+            self.renderer.invalidate()
+    
+    def draw_settings_button(self):
+        """绘制设置按钮（齿轮图标）"""
+        pygame.draw.rect(self.screen, GRAY, self.settings_button_rect)
+        pygame.draw.rect(self.screen, BLACK, self.settings_button_rect, 2)
+        # 简化的齿轮图标（使用字符）
+        gear_text = self.font.render("⚙", True, WHITE)
+        gear_rect = gear_text.get_rect(center=self.settings_button_rect.center)
+        self.screen.blit(gear_text, gear_rect)
     
     def draw_start_screen(self):
         """绘制开始界面"""
@@ -1352,30 +1377,17 @@ class MonopolyGame:
                 self.screen.blit(start_text, start_rect)
     
     def draw_game_screen(self):
-        """绘制游戏界面"""
+        """
+        绘制游戏界面
+        
+        Returns:
+            list: 本帧需要更新的屏幕矩形
+        """
         if not all([self.renderer, self.board, self.game_logic, self.animation_manager]):
-            return
-            
-        # 绘制棋盘
-        if self.renderer and hasattr(self.renderer, 'draw_board'):
-            self.renderer.draw_board(self.board)
-        
-        # 绘制玩家
-        if (self.renderer and hasattr(self.renderer, 'draw_players') and 
-            self.game_logic and hasattr(self.game_logic, 'players')):
-            self.renderer.draw_players(self.game_logic.players, self.board, self.animation_manager)
-        
-        # 绘制UI
-        if self.renderer and hasattr(self.renderer, 'draw_ui'):
-            self.renderer.draw_ui(self.game_logic)
-        
-        # 绘制骰子结果（无动画）
-        if (self.animation_manager and hasattr(self.animation_manager, 'draw_dice_result') and 
-            self.renderer and hasattr(self.renderer, 'font') and
-            self.game_logic and hasattr(self.game_logic, 'dice_result') and
-            hasattr(self.game_logic, 'effect_dice_result')):
-            self.animation_manager.draw_dice_result(
-                self.screen, self.renderer.font, self.game_logic.dice_result, self.game_logic.effect_dice_result)
+            return []
+        
+        # 绘制棋盘、玩家、UI和骰子结果
+        return self.renderer.render_frame(self.game_logic, self.board, self.animation_manager)
     
     def draw_results_screen(self):
         """绘制结果界面"""
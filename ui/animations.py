@@ -89,43 +89,45 @@ class AnimationManager:
                     return True  # 动画完成
         return False
     
-    def get_animated_player_position(self, player_id, board):
-        """获取玩家的动画位置"""
-        if self.player_moving and self.moving_player_id == player_id:
-            # 获取当前步骤的起始和结束格子位置
-            if self.current_step < len(self.move_path) - 1:
-                current_cell = self.move_path[self.current_step]
-                next_cell = self.move_path[self.current_step + 1]
-                
-                # 获取两个格子的屏幕坐标
-                start_x, start_y = board.get_cell_position(current_cell)
-                end_x, end_y = board.get_cell_position(next_cell)
-                
-                # 插值计算当前位置
-                current_x = start_x + (end_x - start_x) * self.step_progress
-                current_y = start_y + (end_y - start_y) * self.step_progress
-                return (int(current_x), int(current_y))
-            else:
-                # 已经到达最后一格
-                final_cell = self.move_path[-1] if self.move_path else 0
-                return board.get_cell_position(final_cell)
-        else:
-            # 非移动中的玩家，返回正常位置
-            return (0, 0)  # 这里会在调用处处理
+    def get_move_segment(self):
+        """
+        获取当前移动步骤的起止格子和进度
+        
+        Returns:
+            tuple: (起始格子, 目标格子, 进度0.0~1.0)，没有移动动画时返回None
+        """
+        if not self.player_moving:
+            return None
+        
+        if self.current_step < len(self.move_path) - 1:
+            return (self.move_path[self.current_step],
+                    self.move_path[self.current_step + 1],
+                    self.step_progress)
+        
+        # 已经到达最后一格
+        final_cell = self.move_path[-1] if self.move_path else 0
+        return (final_cell, final_cell, 0.0)
     
     def draw_dice_result(self, screen, font, dice_result, effect_dice_result=0):
-        """直接绘制骰子结果，无动画"""
+        """
+        直接绘制骰子结果，无动画
+        
+        Returns:
+            pygame.Rect: 骰子绘制区域，没有骰子结果时返回None
+        """
         # 如果有格子效果骰子结果，优先显示
         if effect_dice_result > 0:
             dice_x = WINDOW_WIDTH // 2 - 20
             dice_y = WINDOW_HEIGHT // 2 - 20
-            screen.blit(self.dice_surfaces[effect_dice_result - 1], (dice_x, dice_y))
+            return screen.blit(self.dice_surfaces[effect_dice_result - 1], (dice_x, dice_y))
             
         elif dice_result > 0:
             # 显示移动骰子结果
             dice_x = WINDOW_WIDTH // 2 - 20
             dice_y = WINDOW_HEIGHT // 2 - 20
-            screen.blit(self.dice_surfaces[dice_result - 1], (dice_x, dice_y))
+            return screen.blit(self.dice_surfaces[dice_result - 1], (dice_x, dice_y))
+        
+        return None
     
     def is_any_animation_running(self):
         """检查是否有任何动画正在运行"""
@@ -2,12 +2,55 @@
 游戏渲染模块
 """
 
+import functools
 import pygame
 from models.constants import (
     WHITE, BLACK, RED, GREEN, GRAY, LIGHT_BLUE, GOLD,
     HOME_COLORS, CELL_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT,
-    REWARD_COLOR, DISCARD_COLOR
+    REWARD_COLOR, DISCARD_COLOR, PLAYER_COLORS
 )
+from utils.config_manager import config_manager
+from utils import perf
+
+# 格子半边长
+_HALF = CELL_SIZE // 2
+
+# 棋子贴图半径（包含移动时的发光圈）
+_TOKEN_RADIUS = 12
+
+# 同一格子上各玩家棋子的偏移，避免重叠
+_PLAYER_OFFSETS = [(-7, -7), (8, -7), (-7, 8), (8, 8)]
+
+# 性能浮层在空闲时的刷新间隔（毫秒）
+_PERF_OVERLAY_INTERVAL = 1000
+
+# 可以单独重绘的界面区域
+_UI_REGIONS = ("players", "dice", "message", "status", "button")
+
+# 中文字体候选（按优先级），找不到时使用pygame默认字体
+_CJK_FONT_NAMES = ["simhei", "microsoftyaheimicrosoftyaheiui", "microsoftyahei",
+                   "notosanscjksc", "arialunicodems"]
+
+
+@functools.lru_cache(maxsize=None)
+def _font_path():
+    """查找系统中可用的中文字体文件（只查找一次）"""
+    return pygame.font.match_font(_CJK_FONT_NAMES)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_font(size):
+    """
+    加载指定字号的中文字体，所有渲染器共享同一个字体对象
+    
+    Args:
+        size (int): 字号
+        
+    Returns:
+        pygame.font.Font: 字体对象
+    """
+    return pygame.font.Font(_font_path(), size)
+
 
 class Renderer:
     """游戏渲染类"""
@@ -17,193 +60,661 @@ class Renderer:
         初始化渲染器
         
         Args:
-            screen: pygame屏幕对象
+            screen: pygame屏幕对象（需在pygame.display.set_mode之后创建）
         """
         self.screen = screen
         self.init_fonts()
+        self._build_player_tokens()
+        
+        # 文字渲染缓存：(文本, 颜色, 是否大字体) -> Surface
+        self._text_cache = {}
+        
+        # 玩家信息、骰子点数、状态提示的渲染缓存，以各自的显示状态为键
+        self._player_row_cache = {}
+        self._dice_lines_cache = {}
+        self._status_cache = {}
+        
+        # 棋盘背景缓存
+        self._board_surface = None
+        self._board_signature = None
+        
+        # 按格子编号排列的矩形、颜色，以及按文字分组的格子文字位置
+        self._cell_rects = []
+        self._cell_colors = []
+        self._cell_label_groups = {}
+        
+        # 脏矩形更新：上一帧棋子和骰子的区域（None表示下一帧需要整屏重绘）
+        self._prev_sprite_rects = None
+        
+        # 性能浮层占用的矩形和上次刷新的时间（毫秒）
+        self._perf_overlay_rects = []
+        self._perf_overlay_time = 0
+        
+        # 各界面区域上次绘制时的状态签名和占用的矩形
+        self._ui_region_sigs = dict.fromkeys(_UI_REGIONS)
+        self._ui_region_rects = {name: [] for name in _UI_REGIONS}
+        
+        # 上一帧可见状态的签名，状态未变时跳过绘制
+        self._last_frame_sig = None
+        
+        # 最近一次绘制的按钮区域，没有按钮时为None
+        self.button_rect = None
+        self._init_ui_cache()
     
     def init_fonts(self):
         """初始化字体"""
-        try:
-            # 尝试使用系统中文字体
-            self.font = pygame.font.Font("C:/Windows/Fonts/simhei.ttf", 20)
-            self.big_font = pygame.font.Font("C:/Windows/Fonts/simhei.ttf", 32)
-        except:
-            try:
-                # 备选字体
-                self.font = pygame.font.Font("C:/Windows/Fonts/msyh.ttc", 20)
-                self.big_font = pygame.font.Font("C:/Windows/Fonts/msyh.ttc", 32)
-            except:
-                # 如果找不到中文字体，使用系统默认字体
-                self.font = pygame.font.SysFont("microsoftyaheimicrosoftyaheiui", 20)
-                self.big_font = pygame.font.SysFont("microsoftyaheimicrosoftyaheiui", 32)
+        self.font = _load_font(20)
+        self.big_font = _load_font(32)
     
-    def draw_board(self, board):
+    def _init_ui_cache(self):
+        """预先绘制三种按钮（重新开始、效果骰子、移动骰子）"""
+        self._button_rect = pygame.Rect(WINDOW_WIDTH - 150, WINDOW_HEIGHT - 60, 120, 40)
+        self._btn_restart = self._build_button(GREEN, "重新开始")
+        self._btn_effect = self._build_button(GOLD, "投骰子")
+        self._btn_roll = self._build_button(LIGHT_BLUE, "投骰子")
+    
+    def _build_button(self, color, label):
         """
-        绘制游戏棋盘
+        绘制一个按钮贴图
         
         Args:
+            color (tuple): 按钮背景颜色
+            label (str): 按钮文字
+            
+        Returns:
+            pygame.Surface: 按钮贴图
+        """
+        button = pygame.Surface(self._button_rect.size).convert()
+        rect = button.get_rect()
+        pygame.draw.rect(button, color, rect)
+        pygame.draw.rect(button, BLACK, rect, 2)
+        
+        button_text = self._text(label, BLACK)
+        button.blit(button_text, button_text.get_rect(center=rect.center))
+        return button
+    
+    def _text(self, text, color, big=False):
+        """
+        获取渲染好的文字，相同的文字只渲染一次
+        
+        Args:
+            text (str): 文字内容
+            color (tuple): 文字颜色
+            big (bool): 是否使用大字体
+            
+        Returns:
+            pygame.Surface: 渲染后的文字
+        """
+        key = (text, color, big)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            font = self.big_font if big else self.font
+            # 转换为与屏幕一致的像素格式，避免每次blit时逐像素转换
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    def clear_text_cache(self):
+        """清空文字缓存（字体或颜色变化时调用）"""
+        self._text_cache.clear()
+        self._player_row_cache.clear()
+        self._dice_lines_cache.clear()
+        self._status_cache.clear()
+    
+    def invalidate(self):
+        """标记画面失效，下一帧整屏重绘（画面被其他内容覆盖后调用）"""
+        self._prev_sprite_rects = None
+    
+    def render_frame(self, game_logic, board, animation_manager):
+        """
+        渲染一帧游戏画面，只重绘发生变化的区域
+        
+        Args:
+            game_logic (GameLogic): 游戏逻辑对象
             board (Board): 棋盘对象
+            animation_manager (AnimationManager): 动画管理器
+            
+        Returns:
+            list: 需要传给pygame.display.update的矩形列表
         """
-        self.screen.fill(WHITE)
+        # 棋盘或画面内容没有变化时不做任何绘制（空闲帧不计入性能统计）
+        board_sig = self._board_signature_of(board)
+        board_changed = board_sig != self._board_signature
+        full_repaint = self._prev_sprite_rects is None or board_changed
+        
+        frame_sig = self._frame_signature(game_logic, animation_manager)
+        if not full_repaint and frame_sig == self._last_frame_sig:
+            # 空闲时性能浮层仍按固定间隔刷新
+            if (perf.enabled and
+                    pygame.time.get_ticks() - self._perf_overlay_time >= _PERF_OVERLAY_INTERVAL):
+                return self._update_perf_overlay()
+            return []
+        self._last_frame_sig = frame_sig
+        
+        with perf.scope("render_frame"):
+            if board_changed:
+                with perf.scope("board.cache"):
+                    self._rebuild_board_cache(board, board_sig)
+            dirty_rects = self._render_frame(game_logic, board, animation_manager, full_repaint)
+        
+        # 性能浮层画在最上层，关闭计时后擦除
+        if perf.enabled or self._perf_overlay_rects:
+            dirty_rects.extend(self._update_perf_overlay())
+        return dirty_rects
+    
+    def _render_frame(self, game_logic, board, animation_manager, full_repaint):
+        """绘制一帧游戏画面，返回需要更新的矩形（参见render_frame）"""
+        ui_state = self._ui_state(game_logic)
+        region_sigs = self._ui_region_signatures(game_logic, ui_state)
+        token_blits = self._player_token_blits(game_logic.players, board, animation_manager)
+        
+        with perf.scope("board.erase"):
+            if full_repaint:
+                self.screen.blit(self._board_surface, (0, 0))
+                regions = list(region_sigs)
+                erased_rects = []
+            else:
+                # 被棋子经过或覆盖的界面区域也要重绘，保证界面文字在棋子上方
+                token_rects = [pygame.Rect(pos, token.get_size()) for token, pos in token_blits]
+                regions = self._changed_ui_regions(region_sigs, self._prev_sprite_rects + token_rects)
+                
+                # 用棋盘背景擦除上一帧的棋子、骰子和需要重绘的界面区域
+                erased_rects = list(self._prev_sprite_rects)
+                for name in regions:
+                    erased_rects.extend(self._ui_region_rects[name])
+                blit = self.screen.blit
+                board_surface = self._board_surface
+                for rect in erased_rects:
+                    blit(board_surface, rect, rect)
+        
+        # 棋子和骰子每帧重绘
+        with perf.scope("tokens"):
+            sprite_rects = self.screen.blits(token_blits)
+        with perf.scope("dice_image"):
+            dice_rect = animation_manager.draw_dice_result(
+                self.screen, self.font, game_logic.dice_result, game_logic.effect_dice_result)
+            if dice_rect:
+                sprite_rects.append(dice_rect)
+        
+        ui_rects = self._draw_ui_regions(game_logic, ui_state, region_sigs, regions)
+        
+        if full_repaint:
+            dirty_rects = [self.screen.get_rect()]
+        else:
+            dirty_rects = erased_rects + sprite_rects + ui_rects
+        self._prev_sprite_rects = sprite_rects
+        return dirty_rects
+    
+    def _frame_signature(self, game_logic, animation_manager):
+        """
+        计算当前可见状态的签名
+        
+        Args:
+            game_logic (GameLogic): 游戏逻辑对象
+            animation_manager (AnimationManager): 动画管理器
+            
+        Returns:
+            tuple: 状态签名，签名相同则画面相同
+        """
+        is_local_turn = None
+        if hasattr(game_logic, 'is_local_player_turn'):
+            is_local_turn = game_logic.is_local_player_turn()
+        
+        return (
+            tuple((p.position, p.money, p.is_ai, p.name) for p in game_logic.players),
+            game_logic.current_player,
+            game_logic.dice_result,
+            game_logic.effect_dice_result,
+            game_logic.message,
+            game_logic.waiting_for_effect_dice,
+            game_logic.is_game_over(),
+            is_local_turn,
+            animation_manager.player_moving,
+            animation_manager.moving_player_id,
+            animation_manager.current_step,
+            animation_manager.step_progress,
+            perf.enabled,
+        )
+    
+    def _board_signature_of(self, board):
+        """
+        计算棋盘的签名，棋盘只在签名变化时重新绘制
+        
+        Args:
+            board (Board): 棋盘对象
+            
+        Returns:
+            tuple: 棋盘签名
+        """
+        return (id(board), tuple((cell.type, cell.owner) for cell in board.board))
+    
+    def _rebuild_board_cache(self, board, signature):
+        """
+        重建棋盘背景
+        
+        Args:
+            board (Board): 棋盘对象
+            signature (tuple): _board_signature_of的返回值
+        """
+        self._prepare_board_cache(board)
+        self._board_surface = self._build_board_surface()
+        self._board_signature = signature
+    
+    def _prepare_board_cache(self, board):
+        """
+        预先计算每个格子的矩形、颜色和文字位置
+        
+        Args:
+            board (Board): 棋盘对象
+        """
+        self._cell_rects = []
+        self._cell_colors = []
+        self._cell_label_groups = {}
         
-        # 绘制格子
         for i, (x, y) in enumerate(board.cell_positions):
             cell = board.get_cell(i)
             
-            # 选择格子颜色
+            # 选择格子颜色和类型文字
             if cell.is_home_cell():
                 color = HOME_COLORS[cell.owner]
+                type_text = f"H{cell.owner + 1}"
             elif cell.is_reward_cell():
                 color = REWARD_COLOR
+                type_text = "奖励"
             elif cell.is_penalty_cell():
                 color = DISCARD_COLOR
+                type_text = "丢弃"
             else:
                 color = GRAY
+                type_text = "普通"
             
-            # 绘制格子
-            pygame.draw.rect(self.screen, color, 
-                           (x - CELL_SIZE//2, y - CELL_SIZE//2, CELL_SIZE, CELL_SIZE))
-            pygame.draw.rect(self.screen, BLACK, 
-                           (x - CELL_SIZE//2, y - CELL_SIZE//2, CELL_SIZE, CELL_SIZE), 2)
-            
-            # 显示格子编号
-            text = self.font.render(str(i), True, BLACK)
-            text_rect = text.get_rect(center=(x, y - 20))
-            self.screen.blit(text, text_rect)
+            self._cell_rects.append(
+                pygame.Rect(x - _HALF, y - _HALF, CELL_SIZE, CELL_SIZE))
+            self._cell_colors.append(color)
             
-            # 显示格子类型
-            if cell.is_home_cell():
-                type_text = f"H{cell.owner + 1}"
-            elif cell.is_reward_cell():
-                type_text = "奖励"
-            elif cell.is_penalty_cell():
-                type_text = "丢弃"
+            # 格子编号显示在上方，类型显示在下方；相同文字的位置归为一组
+            for label, center_y in ((str(i), y - 20), (type_text, y + 10)):
+                group = self._cell_label_groups.get(label)
+                if group is None:
+                    group = (self._text(label, BLACK), [])
+                    self._cell_label_groups[label] = group
+                w, h = group[0].get_size()
+                group[1].append((x - w//2, center_y - h//2))
+    
+    def _build_board_surface(self):
+        """
+        将预先计算好的格子绘制到一张背景Surface上
+        
+        Returns:
+            pygame.Surface: 棋盘背景
+        """
+        surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        surface.fill(WHITE)
+        
+        # 绘制格子
+        draw_rect = pygame.draw.rect
+        for rect, color in zip(self._cell_rects, self._cell_colors):
+            draw_rect(surface, color, rect)
+            draw_rect(surface, BLACK, rect, 2)
+        
+        # 显示格子编号和类型，同一文字的所有位置一次性绘制
+        for text, positions in self._cell_label_groups.values():
+            label_blits = [(text, pos) for pos in positions]
+            if hasattr(surface, 'fblits'):
+                # pygame-ce
+                surface.fblits(label_blits)
             else:
-                type_text = "普通"
-            
-            text = self.font.render(type_text, True, BLACK)
-            text_rect = text.get_rect(center=(x, y + 10))
-            self.screen.blit(text, text_rect)
+                surface.blits(label_blits, doreturn=0)
+        return surface
+    
+    def _build_player_tokens(self):
+        """预先绘制每种玩家颜色的棋子（普通和发光两种）"""
+        self._player_tokens = {}
+        self._player_tokens_glow = {}
+        
+        size = _TOKEN_RADIUS * 2 + 1
+        center = (_TOKEN_RADIUS, _TOKEN_RADIUS)
+        for color in PLAYER_COLORS:
+            for glow, tokens in ((False, self._player_tokens), (True, self._player_tokens_glow)):
+                token = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+                if glow:
+                    # 绘制发光效果
+                    pygame.draw.circle(token, GOLD, center, _TOKEN_RADIUS, 2)
+                pygame.draw.circle(token, color, center, 8)
+                pygame.draw.circle(token, BLACK, center, 8, 2)
+                tokens[color] = token
     
-    def draw_players(self, players, board, animation_manager):
+    def _player_token_blits(self, players, board, animation_manager):
         """
-        绘制玩家
+        计算每个玩家棋子的贴图和位置
         
         Args:
             players (list): 玩家列表
             board (Board): 棋盘对象
             animation_manager (AnimationManager): 动画管理器
+            
+        Returns:
+            list: (棋子Surface, 左上角坐标) 列表
         """
+        segment = animation_manager.get_move_segment()
+        moving_id = animation_manager.moving_player_id if segment else -1
+        
+        # 循环中用到的方法先绑定到局部变量
+        get_cell_position = board.get_cell_position
+        tokens = self._player_tokens
+        tokens_glow = self._player_tokens_glow
+        
+        token_blits = []
         for i, player in enumerate(players):
             # 获取玩家当前位置（可能是动画中的位置）
-            if animation_manager.player_moving and animation_manager.moving_player_id == i:
-                pos_x, pos_y = animation_manager.get_animated_player_position(i, board)
+            moving = i == moving_id
+            if moving:
+                # 在当前步骤的两个格子之间插值
+                start_cell, end_cell, progress = segment
+                start_x, start_y = get_cell_position(start_cell)
+                end_x, end_y = get_cell_position(end_cell)
+                pos_x = int(start_x + (end_x - start_x) * progress)
+                pos_y = int(start_y + (end_y - start_y) * progress)
             else:
-                pos_x, pos_y = board.get_cell_position(player.position)
+                pos_x, pos_y = get_cell_position(player.position)
             
             # 为了避免玩家重叠，稍微偏移位置
-            offset_x = (i % 2) * 15 - 7
-            offset_y = (i // 2) * 15 - 7
+            offset_x, offset_y = _PLAYER_OFFSETS[i]
             
-            # 如果是移动中的玩家，添加发光效果
-            if animation_manager.player_moving and animation_manager.moving_player_id == i:
-                # 绘制发光效果
-                pygame.draw.circle(self.screen, GOLD, 
-                                 (pos_x + offset_x, pos_y + offset_y), 12, 2)
+            # 如果是移动中的玩家，使用带发光效果的棋子
+            token = tokens_glow[player.color] if moving else tokens[player.color]
+            token_blits.append(
+                (token, (pos_x + offset_x - _TOKEN_RADIUS, pos_y + offset_y - _TOKEN_RADIUS)))
+        return token_blits
+    
+    def _ui_state(self, game_logic):
+        """
+        收集绘制界面各区域共用的信息
+        
+        Args:
+            game_logic (GameLogic): 游戏逻辑对象
             
-            pygame.draw.circle(self.screen, player.color, 
-                             (pos_x + offset_x, pos_y + offset_y), 8)
-            pygame.draw.circle(self.screen, BLACK, 
-                             (pos_x + offset_x, pos_y + offset_y), 8, 2)
+        Returns:
+            tuple: (是否联机游戏, 本地玩家昵称, 本地玩家槽位, 当前玩家, 是否显示按钮)
+        """
+        # 检查是否是联机游戏，以及本地玩家的昵称和槽位
+        is_network_game = hasattr(game_logic, 'is_local_player_turn')
+        nick = config_manager.get_nickname()
+        local_slot = getattr(game_logic, 'player_slot', None)
+        current_player = game_logic.get_current_player()
+        
+        # 判断是否应该显示按钮
+        if is_network_game:
+            # 联机游戏：只有本地玩家在自己的回合才能看到按钮
+            should_show_button = game_logic.is_local_player_turn()
+        else:
+            # 单人游戏：当前玩家不是AI就显示按钮
+            should_show_button = not current_player.is_ai
+        
+        return is_network_game, nick, local_slot, current_player, should_show_button
     
-    def draw_ui(self, game_logic):
+    def _ui_region_signatures(self, game_logic, ui_state):
         """
-        绘制用户界面
+        计算各界面区域的状态签名，签名不变的区域不需要重绘
         
         Args:
             game_logic (GameLogic): 游戏逻辑对象
+            ui_state (tuple): _ui_state的返回值
             
         Returns:
-            pygame.Rect: 按钮矩形区域，如果没有按钮则返回None
+            dict: 区域名 -> 状态签名
         """
-        # 绘制玩家信息
-        y_offset = 10
-        for i, player in enumerate(game_logic.players):
-            player_type = player.get_player_type_name()
+        is_network_game, nick, local_slot, current_player, should_show_button = ui_state
+        players = game_logic.players
+        return {
+            "players": tuple(
+                (i, player.money, i == game_logic.current_player, player.is_ai,
+                 getattr(player, 'name', None), nick, is_network_game, local_slot)
+                for i, player in enumerate(players)),
+            "dice": (game_logic.dice_result, game_logic.effect_dice_result, 10 + 30 * len(players)),
+            "message": game_logic.message,
+            "status": (current_player.id, current_player.is_ai, getattr(current_player, 'name', None),
+                       nick, is_network_game, game_logic.waiting_for_effect_dice),
+            "button": (game_logic.is_game_over(), game_logic.waiting_for_effect_dice, should_show_button),
+        }
+    
+    def _changed_ui_regions(self, region_sigs, collide_rects):
+        """
+        找出需要重绘的界面区域
+        
+        Args:
+            region_sigs (dict): 各区域当前的状态签名
+            collide_rects (list): 本帧会被擦除或覆盖的矩形（棋子、骰子）
             
-            # 检查是否是联机游戏
-            is_network_game = hasattr(game_logic, 'is_local_player_turn')
+        Returns:
+            list: 需要重绘的区域名
+        """
+        changed = []
+        for name, sig in region_sigs.items():
+            if sig != self._ui_region_sigs[name] or any(
+                    rect.collidelist(collide_rects) != -1 for rect in self._ui_region_rects[name]):
+                changed.append(name)
+        return changed
+    
+    def _draw_ui_regions(self, game_logic, ui_state, region_sigs, regions):
+        """
+        绘制指定的界面区域并记录它们的签名和矩形
+        
+        Args:
+            game_logic (GameLogic): 游戏逻辑对象
+            ui_state (tuple): _ui_state的返回值
+            region_sigs (dict): 各区域当前的状态签名
+            regions (list): 要绘制的区域名
             
-            if not player.is_ai:
-                # 真人玩家
-                from utils.config_manager import config_manager
-                if is_network_game and hasattr(player, 'name') and player.name != config_manager.get_nickname():
-                    # 联机游戏中的其他玩家，显示他们的昵称
-                    text = f"玩家{i + 1}({player.name}): {player.money}金币"
-                else:
-                    # 本地玩家（单人游戏或联机游戏中的自己），显示配置的昵称
-                    text = f"玩家{i + 1}({config_manager.get_nickname()}): {player.money}金币"
-            else:
-                # AI玩家
-                text = f"{player_type}{i + 1}: {player.money}金币"
+        Returns:
+            list: 本次绘制的矩形
+        """
+        draw_funcs = {
+            "players": self._draw_player_rows,
+            "dice": self._draw_dice_lines,
+            "message": self._draw_message,
+            "status": self._draw_status,
+            "button": self._draw_button,
+        }
+        
+        rects = []
+        for name in regions:
+            sig = region_sigs[name]
+            with perf.scope("ui." + name):
+                region_rects = draw_funcs[name](game_logic, ui_state, sig)
+            self._ui_region_sigs[name] = sig
+            self._ui_region_rects[name] = region_rects
+            rects.extend(region_rects)
+        return rects
+    
+    def _draw_player_rows(self, game_logic, ui_state, sig):
+        """绘制玩家信息，每种状态的文字只渲染一次"""
+        is_network_game, nick, local_slot = ui_state[:3]
+        row_cache = self._player_row_cache
+        
+        y_offset = 10
+        row_blits = []
+        for player, key in zip(game_logic.players, sig):
+            rendered_text = row_cache.get(key)
+            if rendered_text is None:
+                rendered_text = self._render_player_row(
+                    key[0], player, key[2], is_network_game, nick, local_slot)
+                row_cache[key] = rendered_text
+            row_blits.append((rendered_text, (10, y_offset)))
+            y_offset += 30
+        return self.screen.blits(row_blits)
+    
+    def _draw_dice_lines(self, game_logic, ui_state, sig):
+        """绘制骰子点数文字"""
+        dice_blits = self._dice_lines_cache.get(sig)
+        if dice_blits is None:
+            dice_blits = self._build_dice_lines(*sig)
+            self._dice_lines_cache[sig] = dice_blits
+        return self.screen.blits(dice_blits)
+    
+    def _draw_message(self, game_logic, ui_state, sig):
+        """绘制消息"""
+        message_text = self._text(sig, BLACK)
+        return [self.screen.blit(message_text, (10, WINDOW_HEIGHT - 80))]
+    
+    def _draw_status(self, game_logic, ui_state, sig):
+        """绘制当前状态提示"""
+        status_blit = self._status_cache.get(sig)
+        if status_blit is None:
+            is_network_game, nick, _, current_player, _ = ui_state
+            status_blit = self._build_status_line(
+                current_player, is_network_game, nick, game_logic.waiting_for_effect_dice)
+            self._status_cache[sig] = status_blit
+        return [self.screen.blit(*status_blit)]
+    
+    def _draw_button(self, game_logic, ui_state, sig):
+        """绘制按钮，并记录按钮区域"""
+        is_game_over, waiting_for_effect_dice, should_show_button = sig
+        if is_game_over:
+            # 游戏结束时显示重新开始按钮
+            button = self._btn_restart
+        elif waiting_for_effect_dice and should_show_button:
+            # 只有本地玩家在自己的回合等待效果骰子时显示投掷按钮
+            button = self._btn_effect
+        elif should_show_button:
+            # 本地玩家回合显示投骰子按钮
+            button = self._btn_roll
+        else:
+            self.button_rect = None
+            return []
+        
+        self.button_rect = self._button_rect
+        return [self.screen.blit(button, self._button_rect)]
+    
+    def _update_perf_overlay(self):
+        """
+        擦除旧的性能浮层，开启计时时绘制新的浮层
+        
+        Returns:
+            list: 需要更新的矩形
+        """
+        old_rects = self._perf_overlay_rects
+        for rect in old_rects:
+            self.screen.blit(self._board_surface, rect, rect)
+        
+        self._perf_overlay_rects = self._draw_perf_overlay() if perf.enabled else []
+        self._perf_overlay_time = pygame.time.get_ticks()
+        return old_rects + self._perf_overlay_rects
+    
+    def _draw_perf_overlay(self):
+        """
+        在右上角显示中位耗时最长的计时点（F3切换）
+        
+        Returns:
+            list: 绘制的矩形
+        """
+        rects = []
+        y_offset = 70
+        for name, micros in perf.slowest(10):
+            text = self.font.render(f"{name}: {micros:.0f}us", True, BLACK)
+            rects.append(self.screen.blit(text, (WINDOW_WIDTH - 260, y_offset)))
+            y_offset += 22
+        return rects
+    
+    def _render_player_row(self, i, player, is_current, is_network_game, nick, local_slot):
+        """
+        渲染一行玩家信息
+        
+        Args:
+            i (int): 玩家序号
+            player (Player): 玩家对象
+            is_current (bool): 是否为当前回合的玩家
+            is_network_game (bool): 是否是联机游戏
+            nick (str): 本地玩家昵称
+            local_slot (int): 联机游戏中本地玩家的槽位
             
-            # 标注本地玩家
-            is_local_player = False
-            if hasattr(game_logic, 'is_local_player_turn') and hasattr(game_logic, 'player_slot'):
-                # 联机游戏：检查是否是本地玩家槽位
-                is_local_player = (i == game_logic.player_slot)
+        Returns:
+            pygame.Surface: 渲染后的文字
+        """
+        player_type = player.get_player_type_name()
+        player_name = getattr(player, 'name', None)
+        
+        if not player.is_ai:
+            # 真人玩家
+            if is_network_game and player_name is not None and player_name != nick:
+                # 联机游戏中的其他玩家，显示他们的昵称
+                text = f"玩家{i + 1}({player_name}): {player.money}金币"
             else:
-                # 单人游戏：第一个非AI玩家就是本地玩家
-                is_local_player = not player.is_ai
-            
-            if is_local_player:
-                text = f"[你] {text}"
-            
-            if i == game_logic.current_player:
-                text = f">>> {text} <<<"
-            
-            color = BLACK if i != game_logic.current_player else RED
-            rendered_text = self.font.render(text, True, color)
-            self.screen.blit(rendered_text, (10, y_offset))
-            y_offset += 30
+                # 本地玩家（单人游戏或联机游戏中的自己），显示配置的昵称
+                text = f"玩家{i + 1}({nick}): {player.money}金币"
+        else:
+            # AI玩家
+            text = f"{player_type}{i + 1}: {player.money}金币"
         
-        # 绘制骰子结果
-        if game_logic.dice_result > 0:
-            dice_text = f"移动骰子点数: {game_logic.dice_result}"
-            rendered_text = self.font.render(dice_text, True, BLACK)
-            self.screen.blit(rendered_text, (10, y_offset + 20))
-            y_offset += 25
+        # 标注本地玩家
+        is_local_player = False
+        if is_network_game and local_slot is not None:
+            # 联机游戏：检查是否是本地玩家槽位
+            is_local_player = (i == local_slot)
+        else:
+            # 单人游戏：第一个非AI玩家就是本地玩家
+            is_local_player = not player.is_ai
         
-        if game_logic.effect_dice_result > 0:
-            effect_dice_text = f"效果骰子点数: {game_logic.effect_dice_result}"
-            rendered_text = self.font.render(effect_dice_text, True, BLACK)
-            self.screen.blit(rendered_text, (10, y_offset + 20))
+        if is_local_player:
+            text = f"[你] {text}"
         
-        # 绘制消息
-        message_text = self.font.render(game_logic.message, True, BLACK)
-        self.screen.blit(message_text, (10, WINDOW_HEIGHT - 80))
+        if is_current:
+            text = f">>> {text} <<<"
         
-        # 绘制当前状态提示
-        current_player = game_logic.get_current_player()
+        color = RED if is_current else BLACK
+        return self.font.render(text, True, color).convert_alpha()
+    
+    def _build_dice_lines(self, dice_result, effect_dice_result, y_offset):
+        """
+        渲染骰子点数文字
+        
+        Args:
+            dice_result (int): 移动骰子点数
+            effect_dice_result (int): 效果骰子点数
+            y_offset (int): 玩家信息下方的纵坐标
+            
+        Returns:
+            list: (Surface, 坐标) 列表
+        """
+        dice_blits = []
+        if dice_result > 0:
+            dice_text = f"移动骰子点数: {dice_result}"
+            dice_blits.append((self._text(dice_text, BLACK), (10, y_offset + 20)))
+            y_offset += 25
+        
+        if effect_dice_result > 0:
+            effect_dice_text = f"效果骰子点数: {effect_dice_result}"
+            dice_blits.append((self._text(effect_dice_text, BLACK), (10, y_offset + 20)))
+        return dice_blits
+    
+    def _build_status_line(self, current_player, is_network_game, nick, waiting_for_effect_dice):
+        """
+        渲染当前状态提示
         
+        Args:
+            current_player (Player): 当前回合的玩家
+            is_network_game (bool): 是否是联机游戏
+            nick (str): 本地玩家昵称
+            waiting_for_effect_dice (bool): 是否在等待投掷效果骰子
+            
+        Returns:
+            tuple: (Surface, 坐标)
+        """
         # 构建当前玩家名称
         if not current_player.is_ai:
             # 真人玩家
-            from utils.config_manager import config_manager
-            is_network_game = hasattr(game_logic, 'is_local_player_turn')
-            
-            if is_network_game and hasattr(current_player, 'name') and current_player.name != config_manager.get_nickname():
+            name = getattr(current_player, 'name', None)
+            if is_network_game and name is not None and name != nick:
                 # 联机游戏中的其他玩家，显示他们的昵称
-                current_player_name = f"玩家{current_player.id + 1}({current_player.name})"
+                current_player_name = f"玩家{current_player.id + 1}({name})"
             else:
                 # 本地玩家（单人游戏或联机游戏中的自己），显示配置的昵称
-                current_player_name = f"玩家{current_player.id + 1}({config_manager.get_nickname()})"
+                current_player_name = f"玩家{current_player.id + 1}({nick})"
         else:
             # AI玩家
             current_player_name = current_player.get_player_type_name() + str(current_player.id + 1)
         
-        if game_logic.waiting_for_effect_dice:
+        if waiting_for_effect_dice:
             # 明确显示谁需要投掷效果骰子
             status_text = f"等待 {current_player_name} 投掷效果骰子..."
             status_color = GOLD
@@ -212,54 +723,6 @@ class Renderer:
             status_text = f"{current_player_name} 的回合"
             status_color = BLACK
         
-        status_rendered = self.font.render(status_text, True, status_color)
-        status_rect = status_rendered.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT - 40))
-        self.screen.blit(status_rendered, status_rect)
-        
-        # 绘制按钮
-        # 判断是否应该显示按钮
-        should_show_button = False
-        
-        # 如果是网络游戏逻辑
-        if hasattr(game_logic, 'is_local_player_turn'):
-            # 联机游戏：只有本地玩家在自己的回合才能看到按钮
-            should_show_button = game_logic.is_local_player_turn()
-        else:
-            # 单人游戏：当前玩家不是AI就显示按钮
-            should_show_button = not current_player.is_ai
-        
-        if game_logic.is_game_over():
-            # 游戏结束时显示重新开始按钮
-            button_rect = pygame.Rect(WINDOW_WIDTH - 150, WINDOW_HEIGHT - 60, 120, 40)
-            pygame.draw.rect(self.screen, GREEN, button_rect)
-            pygame.draw.rect(self.screen, BLACK, button_rect, 2)
-            
-            button_text = self.font.render("重新开始", True, BLACK)
-            text_rect = button_text.get_rect(center=button_rect.center)
-            self.screen.blit(button_text, text_rect)
-            
-            return button_rect
-        elif game_logic.waiting_for_effect_dice and should_show_button:
-            # 只有本地玩家在自己的回合等待效果骰子时显示投掷按钮
-            button_rect = pygame.Rect(WINDOW_WIDTH - 150, WINDOW_HEIGHT - 60, 120, 40)
-            pygame.draw.rect(self.screen, GOLD, button_rect)
-            pygame.draw.rect(self.screen, BLACK, button_rect, 2)
-            
-            button_text = self.font.render("投骰子", True, BLACK)
-            text_rect = button_text.get_rect(center=button_rect.center)
-            self.screen.blit(button_text, text_rect)
-            
-            return button_rect
-        elif should_show_button:
-            # 本地玩家回合显示投骰子按钮
-            button_rect = pygame.Rect(WINDOW_WIDTH - 150, WINDOW_HEIGHT - 60, 120, 40)
-            pygame.draw.rect(self.screen, LIGHT_BLUE, button_rect)
-            pygame.draw.rect(self.screen, BLACK, button_rect, 2)
-            
-            button_text = self.font.render("投骰子", True, BLACK)
-            text_rect = button_text.get_rect(center=button_rect.center)
-            self.screen.blit(button_text, text_rect)
-            
-            return button_rect
-        
-        return None 
\ No newline at end of file
+        status_rendered = self.font.render(status_text, True, status_color).convert_alpha()
+        w, h = status_rendered.get_size()
+        return (status_rendered, (WINDOW_WIDTH//2 - w//2, WINDOW_HEIGHT - 40 - h//2))
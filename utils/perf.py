@@ -0,0 +1,90 @@
+"""
+性能计时模块
+记录各绘制步骤的耗时，用于找出渲染中最耗时的部分（按F3显示）
+使用 python -O 运行时计时代码会被完全跳过
+"""
+
+import statistics
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+
+# 每个计时点保留的最近样本数
+MAX_SAMPLES = 120
+
+# 计时点名称 -> 最近的耗时样本（纳秒）
+SAMPLES = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+
+# 是否正在计时（默认关闭，避免平时的额外开销）
+enabled = False
+
+_NULL_SCOPE = nullcontext()
+
+
+class Scope:
+    """计时上下文，退出时把耗时记录到SAMPLES"""
+
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        """
+        初始化计时上下文
+
+        Args:
+            name (str): 计时点名称
+        """
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        SAMPLES[self.name].append(time.perf_counter_ns() - self.start)
+        return False
+
+
+def scope(name):
+    """
+    获取一个计时上下文，未开启计时时返回空上下文
+
+    Args:
+        name (str): 计时点名称
+
+    Returns:
+        计时上下文
+    """
+    if __debug__:
+        if enabled:
+            return Scope(name)
+    return _NULL_SCOPE
+
+
+def toggle():
+    """
+    切换计时开关，并清空已有样本
+
+    Returns:
+        bool: 切换后是否正在计时
+    """
+    global enabled
+    enabled = __debug__ and not enabled
+    SAMPLES.clear()
+    return enabled
+
+
+def slowest(limit=10):
+    """
+    获取中位耗时最长的计时点
+
+    Args:
+        limit (int): 最多返回的数量
+
+    Returns:
+        list: (计时点名称, 中位耗时微秒) 列表，按耗时从大到小排列
+    """
+    medians = [(name, statistics.median(samples) / 1000)
+               for name, samples in SAMPLES.items() if samples]
+    medians.sort(key=lambda item: item[1], reverse=True)
+    return medians[:limit]